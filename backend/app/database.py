@@ -0,0 +1,128 @@
+"""
+SQLite storage for procurement drafts and their analyses.
+"""
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Default location, next to the notices data (mounted as a volume in Docker)
+DEFAULT_DATABASE_PATH = Path(__file__).resolve().parent.parent / "data" / "drafts.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS drafts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    cpv TEXT
+);
+
+CREATE TABLE IF NOT EXISTS analyses (
+    draft_id INTEGER PRIMARY KEY REFERENCES drafts(id),
+    retrieved_notices TEXT NOT NULL,
+    analysis TEXT NOT NULL
+);
+"""
+
+
+class DraftStore:
+    """Drafts and analyses persisted in a SQLite database."""
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_DATABASE_PATH):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by all requests; the lock makes it the single writer
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+
+        # WAL lets readers (including other worker processes) run alongside a write;
+        # NORMAL sync only fsyncs at checkpoints, which is safe in WAL mode
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        logger.info(f"Opened draft database at {self.path}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def create_draft(self, title: str, description: str, cpv: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Insert a draft.
+
+        Returns:
+            The stored draft including its generated id
+        """
+        return self.create_drafts([(title, description, cpv)])[0]
+
+    def create_drafts(self, drafts: List[Tuple[str, str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        Insert several drafts in a single transaction.
+
+        Args:
+            drafts: (title, description, cpv) tuples
+
+        Returns:
+            The stored drafts including their generated ids, in input order
+        """
+        created = []
+        with self._lock, self._conn:
+            for title, description, cpv in drafts:
+                cursor = self._conn.execute(
+                    "INSERT INTO drafts (title, description, cpv) VALUES (?, ?, ?)",
+                    (title, description, cpv)
+                )
+                created.append({
+                    "id": cursor.lastrowid,
+                    "title": title,
+                    "description": description,
+                    "cpv": cpv
+                })
+        return created
+
+    def get_draft(self, draft_id: int) -> Optional[Dict[str, Any]]:
+        """Return the draft with the given id, or None if it doesn't exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, title, description, cpv FROM drafts WHERE id = ?",
+                (draft_id,)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def save_analysis(self, draft_id: int, retrieved_notices: List[dict], analysis: dict) -> None:
+        """Store the analysis for a draft, replacing any previous one."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (draft_id, retrieved_notices, analysis) VALUES (?, ?, ?)",
+                (draft_id, json.dumps(retrieved_notices), json.dumps(analysis))
+            )
+
+    def get_analysis(self, draft_id: int) -> Optional[Dict[str, Any]]:
+        """Return the stored analysis for a draft, or None if it hasn't been analyzed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT draft_id, retrieved_notices, analysis FROM analyses WHERE draft_id = ?",
+                (draft_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "draft_id": row["draft_id"],
+            "retrieved_notices": json.loads(row["retrieved_notices"]),
+            "analysis": json.loads(row["analysis"])
+        }
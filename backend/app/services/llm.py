@@ -15,6 +15,112 @@ logger = logging.getLogger(__name__)
 # Configuration constants
 MAX_DESCRIPTION_EXCERPT_LENGTH = 200
 
+# Prompt templates, built once at import time
+ANALYSIS_PROMPT_TEMPLATE = """You are analyzing a draft public procurement notice for a prototype decision-support system.
+
+    Use ONLY the draft and the provided similar notices.
+    Do NOT invent facts, outcomes, supplier behavior, delays, or budget overruns unless they are clearly stated in the provided text.
+    If information is missing, state that briefly in caveats.
+
+    PROCUREMENT DRAFT
+    Title: {title}
+    Description: {description}{cpv_text}
+
+    SIMILAR NOTICES
+    {similar_context}
+
+    TASK
+    Compare the draft to the similar notices and produce a structured analysis.
+
+    ANALYSIS RULES
+    - Base the analysis only on the provided text.
+    - Keep overlap_summary to 3-5 sentences.
+    - Keep each qualitative_analysis field to 2-3 sentences.
+    - Keep recommendation.rationale to 2-3 sentences.
+    - Keep caveats to 1-3 short sentences.
+    - confidence must be a number between 0.0 and 1.0.
+    - recommendation.decision must be exactly one of:
+    "approve", "revise", "reject"
+    - similar_notices_ranked should include the most relevant retrieved notices first.
+    - Preserve notice_id and score values from the retrieved notices when possible.
+    - Return ONLY valid JSON.
+
+    QUALITATIVE PRIORITIES
+    1. Risk Management:
+    Assess implementation risk, complexity, dependency risk, unclear scope, integration risk, and contract safeguards.
+    2. Sustainability & Social Values:
+    Assess whether the draft mentions environmental, social, or ethical considerations.
+    3. Transparency & Fair Competition:
+    Assess whether the scope and requirements appear clear, fair, and accessible to multiple bidders.
+    4. Innovation & Forward-Thinking:
+    Assess whether the draft appears modern, future-ready, and open to appropriate technological development.
+
+    REQUIRED JSON SCHEMA
+    {{
+    "similar_notices_ranked": [
+        {{
+        "notice_id": "string",
+        "score": 0.0,
+        "title": "string or null",
+        "buyer": "string or null",
+        "cpv_codes": ["string"] or null,
+        "published_date": "string or null"
+        }}
+    ],
+    "overlap_summary": "string",
+    "qualitative_analysis": {{
+        "risk_management": "string",
+        "sustainability_social_values": "string",
+        "transparency_fair_competition": "string",
+        "innovation_forward_thinking": "string"
+    }},
+    "recommendation": {{
+        "decision": "approve | revise | reject",
+        "rationale": "string"
+    }},
+    "confidence": 0.0,
+    "caveats": "string"
+    }}
+
+    Every top-level field in the JSON schema is required. If information is limited, still include the field and keep the value brief.
+    Do not omit caveats.
+
+    Return ONLY the JSON object. No markdown. No code block. No extra commentary."""
+
+STRICT_JSON_RETRY_SUFFIX = """
+
+    CRITICAL JSON RETRY INSTRUCTIONS:
+    - Return ONLY one valid JSON object.
+    - Do NOT use markdown or code fences.
+    - Do NOT include explanations before or after the JSON.
+    - All keys and string values must use double quotes.
+    - confidence must be a numeric value between 0.0 and 1.0.
+    - recommendation.decision must be exactly "approve", "revise", or "reject".
+    - If information is missing, keep the field brief rather than inventing facts.
+
+    Do not omit any required field. If uncertain, use a short string instead of leaving fields out.
+
+    Return ONLY valid JSON."""
+
+# Shared HTTP client so connections to Ollama are pooled across calls
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class SimilarNotice(BaseModel):
     """A similar notice with ranking information."""
@@ -127,26 +233,27 @@ class OllamaClient:
         if not notices:
             return "No similar notices found."
         
-        formatted = []
+        parts: List[str] = []
         for i, notice in enumerate(notices, 1):
             # Get description and truncate if needed (defensive programming)
             desc = notice.get('description_excerpt', 'N/A')
             if desc != 'N/A' and len(desc) > MAX_DESCRIPTION_EXCERPT_LENGTH:
                 desc = desc[:MAX_DESCRIPTION_EXCERPT_LENGTH]
             
-            notice_info = [
-                f"Notice {i}:",
-                f"  ID: {notice.get('notice_id', 'N/A')}",
-                f"  Title: {notice.get('title', 'N/A')}",
-                f"  Buyer: {notice.get('buyer', 'N/A')}",
-                f"  CPV: {', '.join(notice.get('cpv_codes', []))}",
-                f"  Published: {notice.get('published_date', 'N/A')}",
-                f"  Similarity Score: {notice.get('similarity_score', 0):.3f}",
-                f"  Description: {desc}"
-            ]
-            formatted.append("\n".join(notice_info))
+            if i > 1:
+                parts.append("\n\n")
+            parts.extend((
+                "Notice ", str(i), ":",
+                "\n  ID: ", str(notice.get('notice_id', 'N/A')),
+                "\n  Title: ", str(notice.get('title', 'N/A')),
+                "\n  Buyer: ", str(notice.get('buyer', 'N/A')),
+                "\n  CPV: ", ", ".join(notice.get('cpv_codes') or ()),
+                "\n  Published: ", str(notice.get('published_date', 'N/A')),
+                "\n  Similarity Score: ", format(notice.get('similarity_score', 0), ".3f"),
+                "\n  Description: ", str(desc),
+            ))
         
-        return "\n\n".join(formatted)
+        return "".join(parts)
     
     def _create_analysis_prompt(
         self,
@@ -158,93 +265,16 @@ class OllamaClient:
         """Create a compact, strict analysis prompt for Ollama."""
         cpv_text = f"\nCPV Code: {cpv}" if cpv else ""
 
-        return f"""You are analyzing a draft public procurement notice for a prototype decision-support system.
-
-    Use ONLY the draft and the provided similar notices.
-    Do NOT invent facts, outcomes, supplier behavior, delays, or budget overruns unless they are clearly stated in the provided text.
-    If information is missing, state that briefly in caveats.
-
-    PROCUREMENT DRAFT
-    Title: {title}
-    Description: {description}{cpv_text}
-
-    SIMILAR NOTICES
-    {similar_context}
-
-    TASK
-    Compare the draft to the similar notices and produce a structured analysis.
-
-    ANALYSIS RULES
-    - Base the analysis only on the provided text.
-    - Keep overlap_summary to 3-5 sentences.
-    - Keep each qualitative_analysis field to 2-3 sentences.
-    - Keep recommendation.rationale to 2-3 sentences.
-    - Keep caveats to 1-3 short sentences.
-    - confidence must be a number between 0.0 and 1.0.
-    - recommendation.decision must be exactly one of:
-    "approve", "revise", "reject"
-    - similar_notices_ranked should include the most relevant retrieved notices first.
-    - Preserve notice_id and score values from the retrieved notices when possible.
-    - Return ONLY valid JSON.
-
-    QUALITATIVE PRIORITIES
-    1. Risk Management:
-    Assess implementation risk, complexity, dependency risk, unclear scope, integration risk, and contract safeguards.
-    2. Sustainability & Social Values:
-    Assess whether the draft mentions environmental, social, or ethical considerations.
-    3. Transparency & Fair Competition:
-    Assess whether the scope and requirements appear clear, fair, and accessible to multiple bidders.
-    4. Innovation & Forward-Thinking:
-    Assess whether the draft appears modern, future-ready, and open to appropriate technological development.
-
-    REQUIRED JSON SCHEMA
-    {{
-    "similar_notices_ranked": [
-        {{
-        "notice_id": "string",
-        "score": 0.0,
-        "title": "string or null",
-        "buyer": "string or null",
-        "cpv_codes": ["string"] or null,
-        "published_date": "string or null"
-        }}
-    ],
-    "overlap_summary": "string",
-    "qualitative_analysis": {{
-        "risk_management": "string",
-        "sustainability_social_values": "string",
-        "transparency_fair_competition": "string",
-        "innovation_forward_thinking": "string"
-    }},
-    "recommendation": {{
-        "decision": "approve | revise | reject",
-        "rationale": "string"
-    }},
-    "confidence": 0.0,
-    "caveats": "string"
-    }}
-
-    Every top-level field in the JSON schema is required. If information is limited, still include the field and keep the value brief.
-    Do not omit caveats.
-
-    Return ONLY the JSON object. No markdown. No code block. No extra commentary."""
+        return ANALYSIS_PROMPT_TEMPLATE.format_map({
+            "title": title,
+            "description": description,
+            "cpv_text": cpv_text,
+            "similar_context": similar_context,
+        })
     
     def _create_strict_json_prompt(self, original_prompt: str) -> str:
         """Create a stricter retry prompt for JSON-only output."""
-        return f"""{original_prompt}
-
-    CRITICAL JSON RETRY INSTRUCTIONS:
-    - Return ONLY one valid JSON object.
-    - Do NOT use markdown or code fences.
-    - Do NOT include explanations before or after the JSON.
-    - All keys and string values must use double quotes.
-    - confidence must be a numeric value between 0.0 and 1.0.
-    - recommendation.decision must be exactly "approve", "revise", or "reject".
-    - If information is missing, keep the field brief rather than inventing facts.
-
-    Do not omit any required field. If uncertain, use a short string instead of leaving fields out.
-
-    Return ONLY valid JSON."""
+        return original_prompt + STRICT_JSON_RETRY_SUFFIX
     
     async def _call_ollama(self, prompt: str) -> str:
         """
@@ -256,41 +286,56 @@ class OllamaClient:
         Returns:
             The response text from the model
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            request_data = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "stream": False,
-                "format": "json",  # Request JSON format from Ollama
-                "options": {
-                    "temperature": 0,
-                    "num_predict": 800
+        client = get_http_client()
+        request_data = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
                 }
+            ],
+            "stream": True,  # Receive NDJSON chunks as tokens are generated
+            "format": "json",  # Request JSON format from Ollama
+            "options": {
+                "temperature": 0,
+                "num_predict": 800
             }
-            start = time.monotonic()
-            logger.info(f"Calling Ollama at {self.chat_endpoint} with model {self.model}")
+        }
+        start = time.monotonic()
+        logger.info(f"Calling Ollama at {self.chat_endpoint} with model {self.model}")
 
-            response = await client.post(
-                self.chat_endpoint,
-                json=request_data
-            )
+        content_parts: List[str] = []
+        async with client.stream(
+            "POST",
+            self.chat_endpoint,
+            json=request_data,
+            timeout=self.timeout
+        ) as response:
             response.raise_for_status()
 
-            elapsed = time.monotonic() - start
-            logger.info(f"Ollama responded in {elapsed:.2f} seconds")
-            
-            result = response.json()
-            
-            # Extract the message content
-            if "message" in result and "content" in result["message"]:
-                return result["message"]["content"]
-            else:
-                raise ValueError(f"Unexpected response format: {result}")
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+
+                chunk = json.loads(line)
+
+                # Extract the message content delta
+                if "message" in chunk and "content" in chunk["message"]:
+                    if not content_parts:
+                        elapsed = time.monotonic() - start
+                        logger.info(f"Ollama first token after {elapsed:.2f} seconds")
+                    content_parts.append(chunk["message"]["content"])
+                else:
+                    raise ValueError(f"Unexpected response format: {chunk}")
+
+                if chunk.get("done"):
+                    break
+
+        elapsed = time.monotonic() - start
+        logger.info(f"Ollama responded in {elapsed:.2f} seconds")
+
+        return "".join(content_parts)
     
     def _parse_response(self, response_text: str) -> AnalysisResult:
         """
@@ -303,8 +348,8 @@ class OllamaClient:
             Parsed AnalysisResult object
         
         Raises:
-            json.JSONDecodeError: If the response is not valid JSON
-            ValidationError: If the JSON doesn't match the AnalysisResult schema
+            ValidationError: If the response is not valid JSON or doesn't match
+                             the AnalysisResult schema
         """
         # Clean the response text
         response_text = response_text.strip()
@@ -320,14 +365,8 @@ class OllamaClient:
                 lines = lines[:-1]
             response_text = "\n".join(lines)
         
-        # Parse JSON
-        data = json.loads(response_text)
-
-        if "caveats" not in data:
-            data["caveats"] = ""
-        
-        # Validate and return
-        return AnalysisResult(**data)
+        # Parse and validate in one pass (missing caveats fall back to the default)
+        return AnalysisResult.model_validate_json(response_text)
 
 
 async def analyze_draft_with_llm(
@@ -1,17 +1,27 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 import os
 import json
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
+import joblib
+import sklearn
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from app.services.llm import analyze_draft_with_llm, AnalysisResult, MAX_DESCRIPTION_EXCERPT_LENGTH
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+from app.database import DraftStore, DEFAULT_DATABASE_PATH
+from app.services.llm import analyze_draft_with_llm, close_http_client, AnalysisResult, MAX_DESCRIPTION_EXCERPT_LENGTH
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,16 +34,49 @@ notices_data = []
 tfidf_vectorizer = None
 tfidf_matrix = None
 
-# In-memory storage for drafts
-drafts_db: Dict[int, dict] = {}
-analysis_db: Dict[int, dict] = {}
-next_draft_id = 1
+# SQLite storage for drafts and analyses (opened on startup)
+draft_store: Optional[DraftStore] = None
+
+# Fitted TF-IDF model cached between restarts, keyed on the notices file
+TFIDF_CACHE_PATH = Path(__file__).parent / "data" / "tfidf.joblib"
+
+
+def load_or_fit_tfidf(notices: List[dict], source: bytes):
+    """Return (vectorizer, matrix), reusing the cached fit if notices and settings are unchanged"""
+    vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32, sublinear_tf=True)
+
+    # Key on the notices file, the vectorizer settings and the scikit-learn version
+    key_parts = (source, repr(sorted(vectorizer.get_params().items())).encode(), sklearn.__version__.encode())
+    cache_key = hashlib.sha256(b"\0".join(key_parts)).hexdigest()
+
+    if TFIDF_CACHE_PATH.exists():
+        try:
+            cached_key, cached_vectorizer, cached_matrix = joblib.load(TFIDF_CACHE_PATH)
+            if cached_key == cache_key:
+                logger.info(f"Loaded TF-IDF model from cache {TFIDF_CACHE_PATH}")
+                return cached_vectorizer, cached_matrix
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable TF-IDF cache {TFIDF_CACHE_PATH}: {e}")
+
+    # Combine title and description_excerpt for each notice
+    documents = [
+        f"{notice.get('title', '')} {notice.get('description_excerpt', '')}"
+        for notice in notices
+    ]
+    matrix = vectorizer.fit_transform(documents)
+
+    try:
+        joblib.dump((cache_key, vectorizer, matrix), TFIDF_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write TF-IDF cache {TFIDF_CACHE_PATH}: {e}")
+
+    return vectorizer, matrix
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
-    global notices_data, tfidf_vectorizer, tfidf_matrix
+    global notices_data, tfidf_vectorizer, tfidf_matrix, draft_store
     
     # Startup: Load notices data and build TF-IDF
     data_path = Path(__file__).parent / "data" / "notices.cleaned.json"
@@ -48,25 +91,32 @@ async def lifespan(app: FastAPI):
         logger.error(error_msg)
         raise FileNotFoundError(error_msg)
     
-    with open(data_path, 'r') as f:
-        notices_data = json.load(f)
+    source = data_path.read_bytes()
+    if orjson is not None:
+        notices_data = orjson.loads(source)
+    else:
+        notices_data = json.loads(source)
     
     # Build TF-IDF matrix
     if notices_data:
-        # Combine title and description_excerpt for each notice
-        documents = [
-            f"{notice.get('title', '')} {notice.get('description_excerpt', '')}"
-            for notice in notices_data
-        ]
+        tfidf_vectorizer, tfidf_matrix = load_or_fit_tfidf(notices_data, source)
         
-        tfidf_vectorizer = TfidfVectorizer(stop_words='english')
-        tfidf_matrix = tfidf_vectorizer.fit_transform(documents)
+        # Truncate description_excerpt once for storage and API responses. TF-IDF
+        # above is built from the full excerpt, so this must come after the fit.
+        # Note: This is also done in LLM service for defensive programming
+        for notice in notices_data:
+            notice['description_excerpt'] = (notice.get('description_excerpt') or '')[:MAX_DESCRIPTION_EXCERPT_LENGTH]
         
         logger.info(f"Loaded {len(notices_data)} notices and built TF-IDF matrix")
     
+    # Open the draft database
+    draft_store = DraftStore(os.getenv("DATABASE_PATH", DEFAULT_DATABASE_PATH))
+    
     yield
     
-    # Shutdown: cleanup if needed
+    # Shutdown: release pooled connections to Ollama and close the database
+    await close_http_client()
+    draft_store.close()
     logger.info("Shutting down application")
 
 
@@ -86,16 +136,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global variables for TF-IDF
-notices_data = []
-tfidf_vectorizer = None
-tfidf_matrix = None
-
-# In-memory storage for drafts
-drafts_db: Dict[int, dict] = {}
-analysis_db: Dict[int, dict] = {}
-next_draft_id = 1
-
 
 # Pydantic models
 class DraftCreate(BaseModel):
@@ -127,11 +167,33 @@ class Notice(BaseModel):
     similarity_score: float
 
 
+# Notice fields returned from analysis (everything except similarity_score)
+NOTICE_FIELDS = tuple(field for field in Notice.model_fields if field != 'similarity_score')
+
+
 class Analysis(BaseModel):
     draft_id: int
     top_notices: List[Notice]
 
 
+def rank_notices(draft_text: str, top_k: int = 5):
+    """Return (top_indices, similarities) for the notices most similar to draft_text"""
+    # Transform draft text using the same TF-IDF vectorizer
+    draft_vector = tfidf_vectorizer.transform([draft_text])
+    
+    # Calculate cosine similarity with all notices. TfidfVectorizer L2-normalizes
+    # every row (norm='l2'), so cosine similarity reduces to a sparse dot product
+    similarities = (tfidf_matrix @ draft_vector.T).toarray().ravel()
+    
+    # Get top k similar notices
+    top_k = min(top_k, similarities.shape[0])
+    # Partition out the top k, then sort only those k by descending score
+    top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+    top_indices = top_indices[np.argsort(-similarities[top_indices])]
+    
+    return top_indices, similarities
+
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to the EiT AI Project API"}
@@ -142,61 +204,58 @@ async def health():
     return {"status": "healthy"}
 
 
+# Routes that only touch the database are plain `def` so FastAPI runs the
+# blocking sqlite3 calls in its thread pool instead of on the event loop
 @app.post("/drafts", response_model=Draft)
-async def create_draft(draft: DraftCreate):
+def create_draft(draft: DraftCreate):
     """Create a new draft with title, description, and optional CPV"""
-    global next_draft_id
-    
-    draft_id = next_draft_id
-    next_draft_id += 1
-    
-    draft_data = {
-        "id": draft_id,
-        "title": draft.title,
-        "description": draft.description,
-        "cpv": draft.cpv
-    }
-    
-    drafts_db[draft_id] = draft_data
-    
-    return draft_data
+    return draft_store.create_draft(draft.title, draft.description, draft.cpv)
+
+
+@app.post("/drafts/bulk", response_model=List[Draft])
+def create_drafts_bulk(drafts: List[DraftCreate]):
+    """Create several drafts in one request (e.g. when importing from a file)"""
+    # Inserted in a single transaction
+    return draft_store.create_drafts(
+        [(draft.title, draft.description, draft.cpv) for draft in drafts]
+    )
 
 
 @app.post("/drafts/{draft_id}/analyze")
-async def analyze_draft(draft_id: int):
-    """Analyze a draft using TF-IDF retrieval and LLM analysis"""
-    if draft_id not in drafts_db:
-        raise HTTPException(status_code=404, detail="Draft not found")
+async def analyze_draft(draft_id: int, force: bool = False):
+    """Analyze a draft using TF-IDF retrieval and LLM analysis (force=true re-runs a stored analysis)"""
+    # Database and TF-IDF work runs in worker threads so it doesn't block the event loop
+    loop = asyncio.get_running_loop()
     
+    draft = await loop.run_in_executor(None, draft_store.get_draft, draft_id)
+    if draft is None:
+        raise HTTPException(status_code=404, detail="Draft not found")
+
+    # Reuse a successful stored analysis unless the client asks for a fresh one
+    # (e.g. the UI's Re-analyze button); failed LLM runs are always re-run
+    cached = None if force else await loop.run_in_executor(None, draft_store.get_analysis, draft_id)
+    if cached is not None and "error" not in cached["analysis"]:
+        return {
+            "retrieved_notices": cached["retrieved_notices"],
+            "analysis": cached["analysis"]
+        }
+
     if tfidf_vectorizer is None or tfidf_matrix is None:
         raise HTTPException(status_code=503, detail="TF-IDF not initialized")
     
-    draft = drafts_db[draft_id]
-    
     # Combine draft title and description
     draft_text = f"{draft['title']} {draft['description']}"
     
-    # Transform draft text using the same TF-IDF vectorizer
-    draft_vector = tfidf_vectorizer.transform([draft_text])
-    
-    # Calculate cosine similarity with all notices
-    similarities = cosine_similarity(draft_vector, tfidf_matrix)[0]
-    
-    # Get top 10 similar notices
-    top_k = 5
-    top_indices = np.argsort(similarities)[::-1][:top_k]
+    # Rank notices (CPU-bound) in a worker thread
+    top_indices, similarities = await loop.run_in_executor(None, rank_notices, draft_text)
     
     # Build response with top notices
     retrieved_notices = []
     for idx in top_indices:
-        notice = notices_data[idx].copy()
+        source_notice = notices_data[idx]
+        # Only pick the fields of the Notice schema instead of copying the whole record
+        notice = {field: source_notice.get(field) for field in NOTICE_FIELDS}
         notice['similarity_score'] = float(similarities[idx])
-        
-        # Truncate description_excerpt to max length for storage and API response
-        # Note: This is also done in LLM service for defensive programming
-        if 'description_excerpt' in notice and notice['description_excerpt']:
-            notice['description_excerpt'] = notice['description_excerpt'][:MAX_DESCRIPTION_EXCERPT_LENGTH]
-        
         retrieved_notices.append(notice)
     
     # Call LLM to generate analysis
@@ -236,11 +295,7 @@ async def analyze_draft(draft_id: int):
         }
     
     # Store the complete result under draft ID
-    analysis_db[draft_id] = {
-        "draft_id": draft_id,
-        "retrieved_notices": retrieved_notices,
-        "analysis": analysis
-    }
+    await loop.run_in_executor(None, draft_store.save_analysis, draft_id, retrieved_notices, analysis)
     
     # Return both retrieved notices and analysis
     return {
@@ -250,9 +305,10 @@ async def analyze_draft(draft_id: int):
 
 
 @app.get("/drafts/{draft_id}/analysis", response_model=Analysis)
-async def get_analysis(draft_id: int):
+def get_analysis(draft_id: int):
     """Get the analysis results for a draft"""
-    if draft_id not in analysis_db:
+    analysis = draft_store.get_analysis(draft_id)
+    if analysis is None:
         raise HTTPException(status_code=404, detail="Analysis not found for this draft")
     
-    return analysis_db[draft_id]
+    return analysis
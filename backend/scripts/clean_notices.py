@@ -26,8 +26,20 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+DATE_YMD_RE = re.compile(r"^(\d{4})[./](\d{2})[./](\d{2})$")
+DATE_DMY_RE = re.compile(r"^(\d{2})[./](\d{2})[./](\d{4})$")
 CPV_RE = re.compile(r"\b(\d{8})\b")
+CPV_CODE_RE = re.compile(r"\d{8}")
+NOTICE_URL_RE = re.compile(r"/notices/([^/?#]+)")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+REPEATED_SPACES_RE = re.compile(r"[ \t]{2,}")
+NON_NUMERIC_RE = re.compile(r"[^0-9.]")
 
 DEFAULT_EXCERPT_MAX = 1200
 DEFAULT_EXCERPT_MIN = 200
@@ -56,7 +68,10 @@ def load_records(path: Path) -> List[Dict[str, Any]]:
 
 def dump_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
 def normalize_notice_id(n: Dict[str, Any]) -> str:
@@ -65,7 +80,7 @@ def normalize_notice_id(n: Dict[str, Any]) -> str:
         return notice_id
 
     url = str(n.get("url") or "").strip()
-    m = re.search(r"/notices/([^/?#]+)", url)
+    m = NOTICE_URL_RE.search(url)
     if m:
         return m.group(1)
 
@@ -92,7 +107,7 @@ def normalize_cpv_codes(n: Dict[str, Any]) -> List[str]:
             codes = [cpv.strip()]
 
     # Normalize to 8 digits only
-    codes = [c for c in codes if re.fullmatch(r"\d{8}", c)]
+    codes = [c for c in codes if CPV_CODE_RE.fullmatch(c)]
     codes = sorted(set(codes))
     return codes
 
@@ -105,11 +120,11 @@ def normalize_date(s: Any) -> str:
         return t
 
     # Accept common variants like "2026.02.10" or "10.02.2026"
-    m1 = re.match(r"^(\d{4})[./](\d{2})[./](\d{2})$", t)
+    m1 = DATE_YMD_RE.match(t)
     if m1:
         return f"{m1.group(1)}-{m1.group(2)}-{m1.group(3)}"
 
-    m2 = re.match(r"^(\d{2})[./](\d{2})[./](\d{4})$", t)
+    m2 = DATE_DMY_RE.match(t)
     if m2:
         return f"{m2.group(3)}-{m2.group(2)}-{m2.group(1)}"
 
@@ -121,9 +136,9 @@ def clean_whitespace(text: str) -> str:
     # Normalize whitespace without destroying paragraphs too much
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     # Collapse excessive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = BLANK_LINES_RE.sub("\n\n", text)
     # Collapse repeated spaces
-    text = re.sub(r"[ \t]{2,}", " ", text)
+    text = REPEATED_SPACES_RE.sub(" ", text)
     return text.strip()
 
 
@@ -157,7 +172,7 @@ def normalize_estimated_value(n: Dict[str, Any]) -> Optional[float]:
     s = s.replace("NOK", "").replace("kr", "").replace(" ", "")
     s = s.replace(",", ".")
     # keep digits and dot
-    s = re.sub(r"[^0-9.]", "", s)
+    s = NON_NUMERIC_RE.sub("", s)
     if not s:
         return None
     try:
@@ -31,10 +31,12 @@ export async function getDraft(id: number): Promise<Draft> {
 }
 
 /**
- * Trigger analysis for a draft
+ * Trigger analysis for a draft (force re-runs it even if a stored analysis exists)
  */
-export async function analyzeDraft(id: number): Promise<AnalysisResponse> {
-  const response = await api.post<AnalysisResponse>(`/drafts/${id}/analyze`);
+export async function analyzeDraft(id: number, force = false): Promise<AnalysisResponse> {
+  const response = await api.post<AnalysisResponse>(`/drafts/${id}/analyze`, null, {
+    params: force ? { force: true } : undefined,
+  });
   return response.data;
 }
 